@@ -84,7 +84,8 @@ class Evaluator(Generic[_T]):
     """
 
     atoms: dict[AtomType[_AnyValue], Callable[[_AnyValue], _T]]
-    operations: dict[Tree, tuple[Callable[..., _T], bool]]
+    operations: dict[Tree, int]
+    handlers: list[tuple[Callable[..., _T], bool]]
     generic_operation_func: Callable[[Tree, Sequence[_T]], _T]
     generic_atom_func: Callable[[Tree], _T]
 
@@ -92,6 +93,7 @@ class Evaluator(Generic[_T]):
         """Create an empty evaluator."""
         self.atoms = {}
         self.operations = {}
+        self.handlers = []
         self.generic_operation_func = _generic_operation_error
         self.generic_atom_func = _generic_atom_error
 
@@ -105,17 +107,31 @@ class Evaluator(Generic[_T]):
         """Add a generic fallback rule for atoms."""
         self.generic_atom_func = func
 
+    def _add_op(self, head: Tree, func: Callable[..., _T], star_args: bool) -> None:
+        """Register ``func`` for ``head`` in the handler table.
+
+        Each registered head is assigned a small integer id indexing into the
+        ``handlers`` list so that dispatch in the inner evaluation loop is a
+        list indexing operation rather than a dict lookup per node.
+        """
+        op_id = self.operations.get(head)
+        if op_id is not None:
+            self.handlers[op_id] = (func, star_args)
+        else:
+            self.operations[head] = len(self.handlers)
+            self.handlers.append((func, star_args))
+
     def add_op1(self, head: Tree, func: Op1[_T]) -> None:
         """Add an evaluation rule for a particular head."""
-        self.operations[head] = (func, True)
+        self._add_op(head, func, True)
 
     def add_op2(self, head: Tree, func: Op2[_T]) -> None:
         """Add an evaluation rule for a particular head."""
-        self.operations[head] = (func, True)
+        self._add_op(head, func, True)
 
     def add_opn(self, head: Tree, func: OpN[_T]) -> None:
         """Add an evaluation rule for a particular head."""
-        self.operations[head] = (func, False)
+        self._add_op(head, func, False)
 
     def add_op_generic(self, func: Callable[[Tree, Sequence[_T]], _T]) -> None:
         """Add a generic fallback rule for heads."""
@@ -131,12 +147,12 @@ class Evaluator(Generic[_T]):
 
     def eval_operation(self, head: Tree, argvals: Sequence[_T]) -> _T:
         """Evaluate one function with some values."""
-        func_star = self.operations.get(head)
+        op_id = self.operations.get(head)
 
-        if func_star is None:
+        if op_id is None:
             return self.generic_operation_func(head, argvals)
 
-        op_func, star_args = func_star
+        op_func, star_args = self.handlers[op_id]
 
         if star_args:
             result = op_func(*argvals)
@@ -150,19 +166,45 @@ class Evaluator(Generic[_T]):
         return self.eval_forward(expr, values)
 
     def eval_recursive(self, expr: Tree, values: dict[Tree, _T]) -> _T:
-        """Evaluate the expression using recursion."""
+        """Evaluate the expression with a memoized postorder walk.
+
+        The walk is memoized on :class:`Tree` identity so that repeated
+        subexpressions are only evaluated once. This makes the traversal
+        O(graph-size) rather than O(tree-size) which can differ exponentially
+        for expressions with much repeating structure.
+
+        An explicit stack is used rather than actual recursion so that deeply
+        nested expressions do not hit the Python recursion limit and no
+        Python function call is needed per node.
+        """
+        memo: dict[Tree, _T] = {}
+
+        # Each node appears on the stack first unprocessed (children still to
+        # be evaluated) and then processed once its children are in the memo.
+        stack = [(expr, False)]
+
+        while stack:
+            node, processed = stack.pop()
+            if node in values or node in memo:
+                # Use an explicit value if given or the memoized result.
+                continue
+            if processed:
+                head = node.children[0]
+                argvals = [
+                    values[c] if c in values else memo[c] for c in node.children[1:]
+                ]
+                memo[node] = self.eval_operation(head, argvals)
+            elif not node.children:
+                # Convert an Atom to _T
+                memo[node] = self.eval_atom(node)
+            else:
+                stack.append((node, True))
+                for child in node.children[1:]:
+                    stack.append((child, False))
+
         if expr in values:
-            # Use an explicit value if given
             return values[expr]
-        elif not expr.children:
-            # Convert an Atom to _T
-            return self.eval_atom(expr)
-        else:
-            # Recursively evaluate children and then apply this operation.
-            head = expr.children[0]
-            children = expr.children[1:]
-            argvals = [self.eval_recursive(c, values) for c in children]
-            return self.eval_operation(head, argvals)
+        return memo[expr]
 
     def eval_forward(self, expr: Tree, values: dict[Tree, _T]) -> _T:
         """Evaluate the expression using forward evaluation."""
@@ -179,10 +221,22 @@ class Evaluator(Generic[_T]):
                 value = self.eval_atom(atom)
             stack.append(value)
 
-        # Run forward evaluation through the operations
+        # Run forward evaluation through the operations. The handler for each
+        # head is found by indexing the handlers list with the integer id
+        # assigned at registration time.
+        operations = self.operations
+        handlers = self.handlers
         for head, indices in graph.operations:
             argvals = [stack[i] for i in indices]
-            stack.append(self.eval_operation(head, argvals))
+            op_id = operations.get(head)
+            if op_id is None:
+                stack.append(self.generic_operation_func(head, argvals))
+            else:
+                op_func, star_args = handlers[op_id]
+                if star_args:
+                    stack.append(op_func(*argvals))
+                else:
+                    stack.append(op_func(argvals))
 
         # Now stack is the values of the topological sort of expr and stack[-1]
         # is the value of expr.
@@ -258,3 +312,14 @@ class Transformer(Evaluator[Tree]):
         super().__init__()
         self.add_atom_generic(lambda atom: atom)
         self.add_op_generic(lambda head, args: head(*args))
+
+
+try:
+    import rust_protosym
+except ImportError:
+    rust_protosym = None
+
+_have_rust_evaluator = rust_protosym is not None and hasattr(rust_protosym, "Evaluator")
+
+if _have_rust_evaluator:  # pragma: no cover
+    from rust_protosym import Evaluator, Transformer  # type: ignore # noqa
@@ -34,6 +34,12 @@ Wild = AtomType("Wild", str)
 class SymAtomType(Generic[T_sym, T_val]):
     """Wrapper around AtomType to construct atoms as Sym."""
 
+    __slots__ = (
+        "name",
+        "sym",
+        "atom_type",
+    )
+
     name: str
     sym: type[T_sym]
     atom_type: AtomType[T_val]
@@ -126,6 +132,14 @@ class Sym:
     protosym.simplecas::Expr - A subclass of :class:`Sym`.
     """
 
+    # A __weakref__ slot is needed because _all_expressions holds instances
+    # weakly. Subclasses adding their own instance attributes should declare
+    # __slots__ as well.
+    __slots__ = (
+        "__weakref__",
+        "rep",
+    )
+
     _all_expressions: _WeakDict[Any, Any] = _WeakDict()
 
     rep: Tree
@@ -136,7 +150,10 @@ class Sym:
         If an equivalent Sym instance already exists then the same object will
         be returned.
         """
-        if not isinstance(tree_expr, Tree):
+        # Exact type check first: Sym is constructed on every arithmetic
+        # operation and type(x) is a pointer compare whereas isinstance walks
+        # the MRO. The isinstance fallback keeps Tree subclasses working.
+        if type(tree_expr) is not Tree and not isinstance(tree_expr, Tree):
             raise TypeError("First argument to Sym should be Tree")
 
         key = (cls, tree_expr)
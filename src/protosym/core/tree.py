@@ -107,6 +107,7 @@ class Tree:
         "__weakref__",
         "value",
         "children",
+        "_forward_graph",
     )
 
     children: tuple[Tree, ...]
@@ -115,13 +116,18 @@ class Tree:
     value: AnyAtom
     """Docstring for value"""  # pragma: no cover
 
+    _forward_graph: ForwardGraph
+    """Lazily cached result of :func:`forward_graph`."""  # pragma: no cover
+
     def __new__(cls, *children: Tree) -> Tree:
         """Return a prevously created Tree or a new one."""
         previous = _all_trees.get(children, None)
         if previous is not None:
             return previous
 
-        if not all(isinstance(child, Tree) for child in children):
+        if not all(
+            type(child) is Tree or isinstance(child, Tree) for child in children
+        ):
             raise TypeError("All arguments should be Tree.")
 
         obj = object.__new__(cls)
@@ -374,11 +380,20 @@ def forward_graph(expr: Tree) -> ForwardGraph:
     >>> stack[-1] == expr
     True
 
+    The graph is computed once per :class:`Tree` and cached on the node so
+    that repeated evaluation of the same expression does not rebuild it. The
+    returned graph should therefore not be mutated.
+
     See Also
     --------
     topological_sort
     ForwardGraph: The class of the object returned.
     """
+    try:
+        return expr._forward_graph
+    except AttributeError:
+        pass
+
     atoms, heads, nodes = topological_split(expr)
 
     num_atoms = len(atoms)
@@ -393,7 +408,9 @@ def forward_graph(expr: Tree) -> ForwardGraph:
         operations.append((head, arg_indices))
         indices[subexpr] = index
 
-    return ForwardGraph(atoms, heads, operations)
+    graph = ForwardGraph(atoms, heads, operations)
+    expr._forward_graph = graph
+    return graph
 
 
 @dataclass
@@ -28,7 +28,7 @@ from .expr import (
     y,
     zero,
 )
-from .lambdification import lambdify
+from .lambdification import lambdify, lambdify_numba
 from .matrix import Matrix
 
 __all__ = [
@@ -56,4 +56,5 @@ __all__ = [
     "y",
     "bin_expand",
     "lambdify",
+    "lambdify_numba",
 ]
@@ -0,0 +1,221 @@
+"""Bytecode compilation for fast repeated numeric evaluation.
+
+The generic :class:`Evaluator` machinery dispatches through Python callables
+for every node of an expression each time it is evaluated. For repeated
+evaluation of the same expression at different numeric values most of the cost
+is this interpreter dispatch rather than the floating point arithmetic itself.
+
+This module lowers an expression once to a linear program of integer opcodes
+over a flat stack of ``float`` slots. Executing the program is then a single
+while-loop with one opcode comparison per operation and no per-node hash
+lookups. Compiled programs are cached weakly against the underlying
+:class:`Tree` so that repeated calls to :meth:`Expr.eval_f64` with different
+values skip compilation entirely.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+from typing import Any
+from weakref import WeakKeyDictionary as _WeakKeyDict
+
+from protosym.core.tree import forward_graph
+
+if _TYPE_CHECKING:
+    from protosym.core.tree import Tree
+
+
+__all__ = ["CompiledF64", "compile_f64"]
+
+
+#
+# Integer opcodes for the f64 virtual machine. The closed set of heads known
+# to the compiler matches the rules registered with the eval_f64 Evaluator in
+# protosym.simplecas.functions. Expressions using any other head cannot be
+# compiled and fall back to the generic Evaluator.
+#
+_OP_SIN = 0
+_OP_COS = 1
+_OP_POW = 2
+_OP_ADD_N = 3
+_OP_MUL_N = 4
+
+
+class CompiledF64:
+    """Linear bytecode program evaluating an expression as ``float``.
+
+    Instances are created by :func:`compile_f64` rather than directly. The
+    program consists of:
+
+    - ``nslots``: the total number of ``float`` slots needed.
+    - ``consts``: slots prefilled from ``Integer`` atoms.
+    - ``var_slots``: mapping from non-numeric atoms to their slots.
+    - ``code``: a flat list of integers encoding the operations.
+
+    The slots are ordered so that the atoms of the expression come first
+    followed by one slot per operation in topological order. Because the
+    program is lowered from the *graph* form of the expression each distinct
+    subexpression is computed exactly once however many times it is repeated
+    in the tree.
+    """
+
+    def __init__(
+        self,
+        num_atoms: int,
+        consts: list[tuple[int, float]],
+        var_slots: dict[Tree, int],
+        code: list[int],
+        nslots: int,
+    ):
+        """Create a new program (use :func:`compile_f64` instead)."""
+        self.num_atoms = num_atoms
+        self.var_slots = var_slots
+        self.code = code
+        stack = [0.0] * nslots
+        for slot, value in consts:
+            stack[slot] = value
+        self._stack_template = stack
+
+    def __call__(self, values: dict[Tree, float]) -> float:
+        """Execute the program with ``values`` for the variable slots."""
+        stack = self._stack_template.copy()
+        for atom, slot in self.var_slots.items():
+            stack[slot] = values[atom]
+
+        code = self.code
+        ncode = len(code)
+        pc = 0
+        dest = self.num_atoms
+
+        while pc < ncode:
+            op = code[pc]
+            if op == _OP_SIN:
+                stack[dest] = math.sin(stack[code[pc + 1]])
+                pc += 2
+            elif op == _OP_COS:
+                stack[dest] = math.cos(stack[code[pc + 1]])
+                pc += 2
+            elif op == _OP_POW:
+                stack[dest] = math.pow(stack[code[pc + 1]], stack[code[pc + 2]])
+                pc += 3
+            else:
+                n = code[pc + 1]
+                args = [stack[i] for i in code[pc + 2 : pc + 2 + n]]
+                if op == _OP_ADD_N:
+                    stack[dest] = sum(args)
+                else:
+                    stack[dest] = math.prod(args)
+                pc += 2 + n
+            dest += 1
+
+        return stack[-1]
+
+    def call_array(self, values: dict[Tree, Any]) -> Any:
+        """Execute the program with NumPy arrays for the variable slots.
+
+        This runs the same bytecode as :meth:`__call__` but each opcode
+        executes a NumPy ufunc over whole arrays so the Python-level dispatch
+        cost is paid once per operation rather than once per sample point.
+        """
+        try:
+            import numpy as np
+        except ImportError:  # pragma: no cover
+            msg = "numpy needs to be installed to use eval_f64_array."
+            raise ImportError(msg) from None
+
+        stack: list[Any] = list(self._stack_template)
+        for atom, slot in self.var_slots.items():
+            stack[slot] = values[atom]
+
+        code = self.code
+        ncode = len(code)
+        pc = 0
+        dest = self.num_atoms
+
+        while pc < ncode:
+            op = code[pc]
+            if op == _OP_SIN:
+                stack[dest] = np.sin(stack[code[pc + 1]])
+                pc += 2
+            elif op == _OP_COS:
+                stack[dest] = np.cos(stack[code[pc + 1]])
+                pc += 2
+            elif op == _OP_POW:
+                stack[dest] = stack[code[pc + 1]] ** stack[code[pc + 2]]
+                pc += 3
+            else:
+                n = code[pc + 1]
+                # Fold with the binary operators rather than e.g.
+                # np.add.reduce because the arguments can be a mixture of
+                # scalar constants and arrays.
+                result = stack[code[pc + 2]]
+                for i in code[pc + 3 : pc + 2 + n]:
+                    if op == _OP_ADD_N:
+                        result = result + stack[i]
+                    else:
+                        result = result * stack[i]
+                stack[dest] = result
+                pc += 2 + n
+            dest += 1
+
+        return stack[-1]
+
+
+_compiled_f64_cache: _WeakKeyDict[Tree, CompiledF64 | None] = _WeakKeyDict()
+
+
+def compile_f64(expression: Tree) -> CompiledF64 | None:
+    """Compile ``expression`` to a :class:`CompiledF64` program.
+
+    Returns ``None`` if the expression uses any head or atom outside the
+    closed set understood by the compiler in which case the caller should fall
+    back to the generic :class:`Evaluator`. Results (including failures) are
+    cached weakly on ``expression``.
+    """
+    if expression in _compiled_f64_cache:
+        return _compiled_f64_cache[expression]
+
+    program = _compile_f64(expression)
+    _compiled_f64_cache[expression] = program
+    return program
+
+
+def _compile_f64(expression: Tree) -> CompiledF64 | None:
+    """Lower ``expression`` to bytecode (uncached)."""
+    from protosym.simplecas.expr import Add, Integer, Mul, Pow, cos, sin
+
+    op1_codes = {sin.rep: _OP_SIN, cos.rep: _OP_COS}
+    opn_codes = {Add.rep: _OP_ADD_N, Mul.rep: _OP_MUL_N}
+
+    graph = forward_graph(expression)
+
+    consts: list[tuple[int, float]] = []
+    var_slots: dict[Tree, int] = {}
+
+    for slot, atom in enumerate(graph.atoms):
+        if atom.value.atom_type == Integer.atom_type:
+            consts.append((slot, float(atom.value.value)))  # type: ignore
+        else:
+            var_slots[atom] = slot
+
+    code: list[int] = []
+    for head, indices in graph.operations:
+        opcode1 = op1_codes.get(head)
+        opcoden = opn_codes.get(head)
+        if opcode1 is not None and len(indices) == 1:
+            code.append(opcode1)
+            code.append(indices[0])
+        elif head == Pow.rep and len(indices) == 2:
+            code.append(_OP_POW)
+            code.extend(indices)
+        elif opcoden is not None and indices:
+            code.append(opcoden)
+            code.append(len(indices))
+            code.extend(indices)
+        else:
+            return None
+
+    num_atoms = len(graph.atoms)
+    nslots = num_atoms + len(graph.operations)
+    return CompiledF64(num_atoms, consts, var_slots, code, nslots)
@@ -19,3 +19,9 @@ class LLVMNotImplementedError(ProtoSymError):
     """Raised when an operation is not supported for LLVM."""
 
     pass
+
+
+class CodegenNotImplementedError(ProtoSymError):
+    """Raised when an operation is not supported for Python code generation."""
+
+    pass
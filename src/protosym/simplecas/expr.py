@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from functools import reduce, wraps
+from functools import reduce
 from typing import TYPE_CHECKING as _TYPE_CHECKING
-from typing import Any, Callable, TypeVar, Union
+from typing import Any, TypeVar, Union
 
 from protosym.core.evaluate import Transformer
+from protosym.core.exceptions import NoEvaluationRuleError
 from protosym.core.sym import (
     AtomFunc,
     AtomRule,
@@ -15,18 +16,16 @@ from protosym.core.sym import (
     Sym,
     SymDifferentiator,
 )
-from protosym.core.tree import SubsFunc, topological_sort
+from protosym.core.tree import SubsFunc, Tree, topological_sort
 from protosym.simplecas.exceptions import ExpressifyError
 
 T_sym = TypeVar("T_sym", bound=Sym)
 
 
 if _TYPE_CHECKING:
-    from protosym.core.tree import Tree
+    from protosym.simplecas.bytecode import CompiledF64
 
     Expressifiable = Union["Expr", int]
-    ExprBinOp = Callable[["Expr", "Expr"], "Expr"]
-    ExpressifyBinOp = Callable[["Expr", Expressifiable], "Expr"]
 
 
 def expressify(obj: Any) -> Expr:
@@ -65,27 +64,128 @@ def expressify(obj: Any) -> Expr:
     #   contexts e.g. if we know that we are expecting a bool rather than a
     #   number.
     #
-    if isinstance(obj, Expr):
+    if type(obj) is Expr:
         return obj
+    elif type(obj) is int:
+        small = _small_ints.get(obj)
+        return small if small is not None else Integer(obj)
     elif isinstance(obj, int):
+        # e.g. bool which fails the exact type check above.
         return Integer(obj)
     else:
         raise ExpressifyError
 
 
-def expressify_other(method: ExprBinOp) -> ExpressifyBinOp:
-    """Call ``expressify`` on operands in ``__add__`` etc."""
+def _coerce(other: Expressifiable) -> Expr:
+    """Convert the other operand in ``__add__`` etc. to an ``Expr``.
 
-    @wraps(method)
-    def expressify_method(self: Expr, other: Expressifiable) -> Expr:
-        if not isinstance(other, Expr):
-            try:
-                other = expressify(other)
-            except ExpressifyError:
-                return NotImplemented
-        return method(self, other)
+    This is the fast path version of :func:`expressify` used by the arithmetic
+    operators. It is inlined into each operator rather than applied as a
+    decorator so that coercing the common ``Expr`` and ``int`` operand types
+    costs no extra Python frame. Returns ``NotImplemented`` for unsupported
+    types so that the reflected operator can be tried.
+    """
+    if type(other) is Expr:
+        return other
+    if type(other) is int:
+        small = _small_ints.get(other)
+        return small if small is not None else Integer(other)
+    try:
+        return expressify(other)
+    except ExpressifyError:
+        return NotImplemented
+
+
+def _as_int(expr: Expr) -> int | None:
+    """Return the value of an ``Integer`` atom or else ``None``."""
+    rep = expr.rep
+    if not rep.children and rep.value.atom_type == Integer.atom_type:
+        return rep.value.value  # type: ignore
+    return None
+
+
+def _fold_add(lhs: Expr, rhs: Expr, lval: int | None, rval: int | None) -> Expr | None:
+    """Fold ``lhs + rhs`` (see :func:`_maybe_fold`)."""
+    if lval is not None and rval is not None:
+        return Integer(lval + rval)
+    if lhs is zero:
+        return rhs
+    if rhs is zero:
+        return lhs
+    return None
+
+
+def _fold_mul(lhs: Expr, rhs: Expr, lval: int | None, rval: int | None) -> Expr | None:
+    """Fold ``lhs * rhs`` (see :func:`_maybe_fold`)."""
+    if lval is not None and rval is not None:
+        return Integer(lval * rval)
+    if lhs is zero or rhs is zero:
+        return zero
+    if lhs is one:
+        return rhs
+    if rhs is one:
+        return lhs
+    return None
+
+
+def _fold_pow(lhs: Expr, rhs: Expr, lval: int | None, rval: int | None) -> Expr | None:
+    """Fold ``lhs ** rhs`` (see :func:`_maybe_fold`)."""
+    if lval is not None and rval is not None and rval >= 0:
+        return Integer(lval**rval)
+    if rhs is one:
+        return lhs
+    if rhs is zero:
+        return one
+    return None
+
+
+def _maybe_fold(head: Expr, lhs: Expr, rhs: Expr) -> Expr | None:
+    """Constant-fold ``head(lhs, rhs)`` where possible.
+
+    Returns the folded ``Expr`` when both operands are ``Integer`` atoms or
+    when a simple identity like ``Add(x, 0) -> x`` applies. Otherwise returns
+    ``None`` and the caller builds the compound expression. This is only used
+    by the arithmetic operators (``+``, ``*``, ``**``, ...) with ``head``
+    being ``Add``, ``Mul`` or ``Pow``: building an expression explicitly with
+    e.g. ``Add(1, 2)`` never folds.
+    """
+    lval = _as_int(lhs)
+    rval = _as_int(rhs)
+    if head is Add:
+        return _fold_add(lhs, rhs, lval, rval)
+    elif head is Mul:
+        return _fold_mul(lhs, rhs, lval, rval)
+    else:
+        return _fold_pow(lhs, rhs, lval, rval)
+
+
+def _call2(head: Expr, lhs: Expr, rhs: Expr) -> Expr:
+    """Build ``head(lhs, rhs)`` directly from the reps.
+
+    Internal building sites always have ``Expr`` operands already so this
+    skips the per-argument expressify and the argument list building done by
+    the generic :meth:`Expr.__call__`.
+    """
+    return Expr(Tree(head.rep, lhs.rep, rhs.rep))
 
-    return expressify_method
+
+def _binop(head: Expr, lhs: Expr, rhs: Expr) -> Expr:
+    """Build ``head(lhs, rhs)`` after trying to constant-fold it.
+
+    Chained ``+`` and ``*`` flatten into a single n-ary operation so that
+    ``x + y + z`` gives ``Add(x, y, z)`` rather than ``Add(Add(x, y), z)``.
+    This is safe because ``Add`` and ``Mul`` are n-ary operations anyway (see
+    the ``add_opn`` evaluation rules) and it keeps the depth of a chained sum
+    or product O(1) rather than O(n).
+    """
+    folded = _maybe_fold(head, lhs, rhs)
+    if folded is not None:
+        return folded
+    if head is Add or head is Mul:
+        lrep = lhs.rep
+        if lrep.children and lrep.children[0] is head.rep:
+            return Expr(Tree(*lrep.children, rhs.rep))
+    return _call2(head, lhs, rhs)
 
 
 class Expr(Sym):
@@ -113,15 +213,16 @@ class Expr(Sym):
     >>> x + y
     (x + y)
 
-    This has some surprising consequences such as the preservation of the order
-    of binary operations.
+    Chains of the associative operators ``+`` and ``*`` are the one exception:
+    they are flattened into a single n-ary operation rather than a nested
+    binary tree.
 
     >>> x + x + x
-    ((x + x) + x)
+    (x + x + x)
 
-    Here the :class:`Expr` was created by evaluating the Python code ``x + x +
-    x`` which is in fact evaluated as ``((x + x) + x)``. Since :class:`Expr`
-    preserves this form that is what the resulting expression will be.
+    Here the Python code ``x + x + x`` is in fact evaluated as ``((x + x) +
+    x)`` but since ``Add`` is an n-ary operation the chain is collected into
+    ``Add(x, x, x)``.
 
     On the other hand if brackets are included explicitly then they will be
     preserved.
@@ -152,6 +253,22 @@ class Expr(Sym):
     to_sympy
     """
 
+    #
+    # Because Expr instances are interned and immutable the string and fully
+    # numeric forms are pure functions of the instance and can be cached on it
+    # for its lifetime. These are the only instance attributes beyond the rep
+    # slot inherited from Sym so no per-instance __dict__ is needed.
+    #
+    __slots__ = (
+        "_repr_cache",
+        "_latex_cache",
+        "_f64_cache",
+    )
+
+    _repr_cache: str
+    _latex_cache: str
+    _f64_cache: float
+
     def __repr__(self) -> str:
         """Pretty string representation of the expression."""
         return self.eval_repr()
@@ -204,61 +321,97 @@ class Expr(Sym):
 
     def __neg__(self) -> Expr:
         """+Expr -> Expr."""
-        return Mul(negone, self)
+        return _negate(self)
 
-    @expressify_other
-    def __add__(self, other: Expr) -> Expr:
+    def __add__(self, other: Expressifiable) -> Expr:
         """Expr + Expr -> Expr."""
-        return Add(self, other)
+        other = _coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return _binop(Add, self, other)
 
-    @expressify_other
-    def __radd__(self, other: Expr) -> Expr:
+    def __radd__(self, other: Expressifiable) -> Expr:
         """Expr + Expr -> Expr."""
-        return Add(other, self)
+        other = _coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return _binop(Add, other, self)
 
-    @expressify_other
-    def __sub__(self, other: Expr) -> Expr:
+    def __sub__(self, other: Expressifiable) -> Expr:
         """Expr - Expr -> Expr."""
-        return Add(self, Mul(negone, other))
-
-    @expressify_other
-    def __rsub__(self, other: Expr) -> Expr:
+        other = _coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
+        lval, rval = _as_int(self), _as_int(other)
+        if lval is not None and rval is not None:
+            return Integer(lval - rval)
+        return _subtract(self, other)
+
+    def __rsub__(self, other: Expressifiable) -> Expr:
         """Expr - Expr -> Expr."""
-        return Add(other, Mul(negone, self))
-
-    @expressify_other
-    def __mul__(self, other: Expr) -> Expr:
+        other = _coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
+        lval, rval = _as_int(other), _as_int(self)
+        if lval is not None and rval is not None:
+            return Integer(lval - rval)
+        return _subtract(other, self)
+
+    def __mul__(self, other: Expressifiable) -> Expr:
         """Expr * Expr -> Expr."""
-        return Mul(self, other)
+        other = _coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return _binop(Mul, self, other)
 
-    @expressify_other
-    def __rmul__(self, other: Expr) -> Expr:
+    def __rmul__(self, other: Expressifiable) -> Expr:
         """Expr * Expr -> Expr."""
-        return Mul(other, self)
+        other = _coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return _binop(Mul, other, self)
 
-    @expressify_other
-    def __truediv__(self, other: Expr) -> Expr:
+    def __truediv__(self, other: Expressifiable) -> Expr:
         """Expr / Expr -> Expr."""
-        return Mul(self, Pow(other, negone))
+        other = _coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return _divide(self, other)
 
-    @expressify_other
-    def __rtruediv__(self, other: Expr) -> Expr:
+    def __rtruediv__(self, other: Expressifiable) -> Expr:
         """Expr / Expr -> Expr."""
-        return Mul(other, Pow(self, negone))
+        other = _coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return _divide(other, self)
 
-    @expressify_other
-    def __pow__(self, other: Expr) -> Expr:
+    def __pow__(self, other: Expressifiable) -> Expr:
         """Expr ** Expr -> Expr."""
-        return Pow(self, other)
+        other = _coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return _binop(Pow, self, other)
 
-    @expressify_other
-    def __rpow__(self, other: Expr) -> Expr:
+    def __rpow__(self, other: Expressifiable) -> Expr:
         """Expr ** Expr -> Expr."""
-        return Pow(other, self)
+        other = _coerce(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return _binop(Pow, other, self)
 
     def eval_repr(self) -> str:
         """Pretty string e.g. "cos(x) + 1"."""
-        return eval_repr(self)
+        try:
+            return self._repr_cache
+        except AttributeError:
+            pass
+        from protosym.simplecas.printing import print_repr
+
+        result = print_repr(self.rep)
+        if result is None:
+            result = eval_repr(self)
+        self._repr_cache = result
+        return result
 
     def eval_latex(self) -> str:
         r"""Return a LaTeX representaton of the expression.
@@ -271,7 +424,17 @@ class Expr(Sym):
         >>> print(expr.eval_latex())
         \sin(x^{2})
         """
-        return eval_latex(self)
+        try:
+            return self._latex_cache
+        except AttributeError:
+            pass
+        from protosym.simplecas.printing import print_latex
+
+        result = print_latex(self.rep)
+        if result is None:
+            result = eval_latex(self)
+        self._latex_cache = result
+        return result
 
     def to_sympy(self) -> Any:
         """Convert to a SymPy expression.
@@ -350,8 +513,71 @@ class Expr(Sym):
         Python floats are based on IEEE 754 64-bit binary floating point which
         gives 53 bits of precision and a range of magnitudes approximately from
         :math:`10^{-300}` to :math:`10^{300}`.
+
+        Notes
+        -----
+        Expressions built only from the standard heads (``Add``, ``Mul``,
+        ``Pow``, ``sin``, ``cos``) are compiled once to a linear bytecode
+        program that is cached and reused by subsequent calls. Expressions
+        using other heads are evaluated by the generic ``eval_f64``
+        :class:`Evaluator`.
+        """
+        if values is None:
+            try:
+                return self._f64_cache
+            except AttributeError:
+                pass
+
+        result = None
+        program = self._compile_f64()
+        if program is not None:
+            values_rep = {}
+            if values is not None:
+                values_rep = {e.rep: v for e, v in values.items()}
+            if all(atom in values_rep for atom in program.var_slots):
+                result = program(values_rep)
+        if result is None:
+            result = eval_f64(self, values)
+
+        if values is None:
+            self._f64_cache = result
+        return result
+
+    def _compile_f64(self) -> CompiledF64 | None:
+        """Compile to bytecode for fast evaluation (``None`` if not possible)."""
+        from protosym.simplecas.bytecode import compile_f64
+
+        return compile_f64(self.rep)
+
+    def eval_f64_array(self, values: dict[Expr, Any] | None = None) -> Any:
+        """Evaluate the expression over NumPy arrays of values.
+
+        This evaluates the expression elementwise at many points at once by
+        running the same compiled bytecode as :meth:`eval_f64` with NumPy
+        ufuncs so the Python-level dispatch cost is paid once per operation
+        rather than once per point.
+
+        >>> # xdoctest: +REQUIRES(module:numpy)
+        >>> import numpy as np
+        >>> from protosym.simplecas import sin, x
+        >>> sin(x).eval_f64_array({x: np.array([0.0, 1.0])})
+        array([0.        , 0.84147098])
+
+        Unlike :meth:`eval_f64` there is no fallback to the generic evaluator
+        because its rules are scalar functions, so an expression using any
+        head unknown to the compiler raises :class:`NoEvaluationRuleError`.
         """
-        return eval_f64(self, values)
+        program = self._compile_f64()
+        if program is None:
+            msg = "Cannot compile for array evaluation: " + repr(self)
+            raise NoEvaluationRuleError(msg)
+        values_rep = {}
+        if values is not None:
+            values_rep = {e.rep: v for e, v in values.items()}
+        for atom in program.var_slots:
+            if atom not in values_rep:
+                raise NoEvaluationRuleError("No value for atom: " + repr(atom))
+        return program.call_array(values_rep)
 
     def count_ops_tree(self) -> int:
         """Count operations in ``Expr`` following tree representation.
@@ -543,6 +769,14 @@ zero = Integer(0)
 one = Integer(1)
 negone = Integer(-1)
 
+#
+# Small integers appear constantly in expressions (e.g. negone in __neg__ and
+# exponents in __truediv__) so cache them once at import time like CPython's
+# small int cache. Holding strong references here also keeps the atoms alive
+# in the weak interning dicts.
+#
+_small_ints = {i: Integer(i) for i in range(-16, 257)}
+
 x = Symbol("x")
 y = Symbol("y")
 
@@ -556,6 +790,40 @@ Add = Function("Add")
 Mul = Function("Mul")
 List = Function("List")
 
+
+#
+# Builders for the operators that combine with the negone singleton on every
+# call. They live down here after the singletons exist so that the constants
+# bind as default arguments, making each a LOAD_FAST at call time rather than
+# a module-global lookup per arithmetic operation.
+#
+def _negate(expr: Expr, _mul: Tree = Mul.rep, _negone: Tree = negone.rep) -> Expr:
+    """Build ``-expr`` as ``Mul(-1, expr)``."""
+    return Expr(Tree(_mul, _negone, expr.rep))
+
+
+def _subtract(
+    lhs: Expr,
+    rhs: Expr,
+    _add: Tree = Add.rep,
+    _mul: Tree = Mul.rep,
+    _negone: Tree = negone.rep,
+) -> Expr:
+    """Build ``lhs - rhs`` as ``Add(lhs, Mul(-1, rhs))``."""
+    return Expr(Tree(_add, lhs.rep, Tree(_mul, _negone, rhs.rep)))
+
+
+def _divide(
+    lhs: Expr,
+    rhs: Expr,
+    _mul: Tree = Mul.rep,
+    _pow: Tree = Pow.rep,
+    _negone: Tree = negone.rep,
+) -> Expr:
+    """Build ``lhs / rhs`` as ``Mul(lhs, Pow(rhs, -1))``."""
+    return Expr(Tree(_mul, lhs.rep, Tree(_pow, rhs.rep, _negone)))
+
+
 bin_expand = Transformer()
 bin_expand.add_opn(Add.rep, lambda args: reduce(Add.rep, args))
 bin_expand.add_opn(Mul.rep, lambda args: reduce(Mul.rep, args))
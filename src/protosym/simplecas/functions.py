@@ -1,6 +1,9 @@
 """Basic functions and operations."""
 
+from __future__ import annotations
+
 import math
+from typing import Sequence
 
 from protosym.core.sym import (
     AtomFunc,
@@ -37,8 +40,16 @@ b = Expr.new_wild("b")
 #                                                                           #
 # ------------------------------------------------------------------------- #
 
+
+def _f64_sum(args: Sequence[float]) -> float:
+    """Sum of floats without :func:`math.fsum`'s exact-summation overhead."""
+    if len(args) == 2:
+        return args[0] + args[1]
+    return sum(args)
+
+
 f64_from_int = PyFunc1[int, float](float)
-f64_add = PyOpN[float](math.fsum)
+f64_add = PyOpN[float](_f64_sum)
 f64_mul = PyOpN[float](math.prod)
 f64_pow = PyOp2[float](math.pow)
 f64_sin = PyOp1[float](math.sin)
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import ctypes
+import math
 import struct
 from typing import TYPE_CHECKING as _TYPE_CHECKING
 from typing import Any, Callable
 
 from protosym.core.tree import forward_graph
-from protosym.simplecas.exceptions import LLVMNotImplementedError
+from protosym.simplecas.exceptions import (
+    CodegenNotImplementedError,
+    LLVMNotImplementedError,
+)
 from protosym.simplecas.expr import Add, Expr, Integer, Mul, Pow, bin_expand, cos, sin
 from protosym.simplecas.matrix import Matrix
 
@@ -103,6 +107,87 @@ def lambdify(args: list[Expr], expression: Expr | Matrix) -> Callable[..., Any]:
         raise TypeError("Expression should be Expr or Matrix.")
 
 
+def _to_python_f64(symargs: list[Tree], expression: Tree) -> str:
+    """Python source for a function computing ``expression`` from ``symargs``.
+
+    The source is straight-line code over the forward graph of the expression
+    so repeated subexpressions are computed once and there is no recursion.
+    """
+    graph = forward_graph(expression)
+
+    argnames = {s: f"_x{i}" for i, s in enumerate(symargs)}
+
+    identifiers = []
+    for a in graph.atoms:
+        if a in argnames:
+            identifiers.append(argnames[a])
+        elif a.value is not None and a.value.atom_type == Integer.atom_type:
+            # Parenthesized so that e.g. (-2.0) ** _x0 does not parse as
+            # -(2.0 ** _x0).
+            identifiers.append(f"({float(a.value.value)!r})")  # type: ignore
+        else:
+            raise CodegenNotImplementedError("No codegen rule for: " + repr(a))
+
+    args = ", ".join(argnames.values())
+    lines = [f"def _jit_func1({args}):"]
+
+    for n, (func, indices) in enumerate(graph.operations):
+        identifier = f"_t{n}"
+        argids = [identifiers[i] for i in indices]
+
+        if func == Add.rep:
+            rhs = " + ".join(argids)
+        elif func == Mul.rep:
+            rhs = "*".join(argids)
+        elif func == Pow.rep:
+            rhs = f"{argids[0]} ** {argids[1]}"
+        elif func == sin.rep:
+            rhs = f"sin({argids[0]})"
+        elif func == cos.rep:
+            rhs = f"cos({argids[0]})"
+        else:
+            raise CodegenNotImplementedError("No codegen rule for: " + repr(func))
+
+        identifiers.append(identifier)
+        lines.append(f"    {identifier} = {rhs}")
+
+    lines.append(f"    return {identifiers[-1]}")
+    return "\n".join(lines)
+
+
+def lambdify_numba(args: list[Expr], expression: Expr) -> Callable[..., float]:
+    """Turn ``expression`` into a function of ``args`` JIT compiled with numba.
+
+    The expression is lowered to straight-line Python code which is then
+    compiled with ``numba.njit``. If numba is not installed the plain Python
+    function is returned instead.
+
+    >>> from protosym.simplecas import Symbol, sin
+    >>> from protosym.simplecas.lambdification import lambdify_numba
+    >>> x = Symbol('x')
+    >>> f = lambdify_numba([x], sin(x))
+    >>> f(1.0)
+    0.8414709848078965
+
+    See Also
+    --------
+    lambdify: lambdification based on LLVM.
+    """
+    args_rep = [arg.rep for arg in args]
+    source = _to_python_f64(args_rep, expression.rep)
+
+    namespace: dict[str, Any] = {"sin": math.sin, "cos": math.cos}
+    exec(source, namespace)
+    func: Callable[..., float] = namespace["_jit_func1"]
+
+    try:
+        import numba
+    except ImportError:
+        return func
+
+    return numba.njit(func)  # type: ignore # pragma: no cover
+
+
 _exe_eng = []
 
 
@@ -0,0 +1,122 @@
+"""Fast printing of the repr and LaTeX forms.
+
+The ``eval_repr`` and ``eval_latex`` :class:`Evaluator` instances differ only
+in how each head and atom is formatted, yet each does a full dispatching walk
+per call. This module renders both forms from the forward graph of the
+expression, which is lowered once per :class:`Tree` and cached, using a plain
+table of formatting functions per format. Each distinct subexpression is
+formatted exactly once however many times it repeats in the tree.
+
+The tables below mirror the rules registered with ``eval_repr`` and
+``eval_latex`` in :mod:`protosym.simplecas.functions`. Expressions using an
+atom type outside the standard set or a head with a rule registered with the
+evaluators but unknown to the tables are not handled here and the caller
+falls back to the generic evaluators, mirroring how the bytecode compiler
+falls back for ``eval_f64``.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+from typing import Any, Callable
+
+from protosym.core.tree import forward_graph
+
+if _TYPE_CHECKING:
+    from protosym.core.tree import Tree
+
+    _FormatFunc = Callable[[list[str]], str]
+    _Table = tuple[dict[Tree, _FormatFunc], dict[Tree, int], set[Any]]
+
+
+__all__ = ["print_repr", "print_latex"]
+
+
+@lru_cache(maxsize=None)
+def _make_tables() -> tuple[_Table, _Table]:
+    """Build the formatting tables (deferred to avoid a circular import).
+
+    Each table is the formatting functions per head, the live ``operations``
+    dict of the corresponding :class:`Evaluator` (used to detect heads with
+    registered rules the table does not know about) and the handled atom
+    types.
+    """
+    from protosym.simplecas.expr import (
+        Add,
+        Function,
+        Integer,
+        Mul,
+        Pow,
+        Symbol,
+        cos,
+        eval_latex,
+        eval_repr,
+        sin,
+    )
+
+    repr_ops: dict[Tree, _FormatFunc] = {
+        Add.rep: lambda args: f'({" + ".join(args)})',
+        Mul.rep: lambda args: f'({"*".join(args)})',
+        Pow.rep: lambda args: f"{args[0]}**{args[1]}",
+    }
+    latex_ops: dict[Tree, _FormatFunc] = {
+        Add.rep: lambda args: f'({" + ".join(args)})',
+        Mul.rep: lambda args: "(%s)" % r" \times ".join(args),
+        Pow.rep: lambda args: f"{args[0]}^{{{args[1]}}}",
+        sin.rep: lambda args: rf"\sin({args[0]})",
+        cos.rep: lambda args: rf"\cos({args[0]})",
+    }
+    atom_types = {Integer.atom_type, Symbol.atom_type, Function.atom_type}
+    repr_table = (repr_ops, eval_repr.evaluator.operations, atom_types)
+    latex_table = (latex_ops, eval_latex.evaluator.operations, atom_types)
+    return repr_table, latex_table
+
+
+def _print_graph(
+    expression: Tree,
+    ops: dict[Tree, _FormatFunc],
+    registered: dict[Tree, int],
+    atom_types: set[Any],
+) -> str | None:
+    """Render ``expression`` with the formatting table ``ops``.
+
+    Returns ``None`` if the expression uses an atom type outside
+    ``atom_types`` or a head that has a rule registered with the evaluator
+    but no entry in ``ops``, in which case the caller should use the
+    evaluator. Any other head formats as ``head(arg, ...)`` matching the
+    generic ``HeadRule`` registered with both evaluators.
+    """
+    graph = forward_graph(expression)
+
+    stack: list[str] = []
+    for atom in graph.atoms:
+        if atom.value.atom_type not in atom_types:
+            return None
+        stack.append(str(atom.value.value))
+
+    for head, indices in graph.operations:
+        args = [stack[i] for i in indices]
+        fmt = ops.get(head)
+        if fmt is not None:
+            stack.append(fmt(args))
+        elif head in registered:
+            # A rule like eval_repr[tan(a)] = ... was registered with the
+            # evaluator so the generic format below would be wrong.
+            return None
+        else:
+            stack.append(f'{head}({", ".join(args)})')
+
+    return stack[-1]
+
+
+def print_repr(expression: Tree) -> str | None:
+    """Pretty string form of ``expression`` (``None`` to use the evaluator)."""
+    (ops, registered, atom_types), _ = _make_tables()
+    return _print_graph(expression, ops, registered, atom_types)
+
+
+def print_latex(expression: Tree) -> str | None:
+    """LaTeX form of ``expression`` (``None`` to use the evaluator)."""
+    _, (ops, registered, atom_types) = _make_tables()
+    return _print_graph(expression, ops, registered, atom_types)
@@ -1,5 +1,5 @@
 import math
-from typing import Callable
+from typing import Callable, Sequence
 
 from protosym.core.atom import AtomType
 from protosym.core.evaluate import Evaluator, Transformer
@@ -51,6 +51,59 @@ def test_Evaluator() -> None:
         for func in eval_funcs:
             assert func(expr, vals) == expected
 
+    # A value given for the expression itself is returned directly.
+    assert eval_f64.eval_recursive(x, {x: 2.0}) == 2.0
+    assert eval_f64.eval_recursive(sin(x), {sin(x): 3.0}) == 3.0
+
+
+def test_Evaluator_re_register() -> None:
+    """Test that re-registering a rule for a head replaces the old rule."""
+    [f, g], [x] = funcs_symbols(["f", "g"], ["x"])
+
+    ev = Evaluator[Tree]()
+    ev.add_atom_generic(lambda atom: atom)
+    ev.add_opn(f, lambda args: f(*args))
+    assert ev(f(x)) == f(x)
+
+    ev.add_opn(f, lambda args: g(*args))
+    assert ev(f(x)) == g(x)
+
+
+def test_Evaluator_graph_memoized() -> None:
+    """Test that shared subexpressions are evaluated once per walk."""
+    [f], [x] = funcs_symbols(["f"], ["x"])
+
+    calls = []
+
+    def f_op(args: Sequence[Tree]) -> Tree:
+        calls.append(args)
+        return f(*args)
+
+    eval_graph = Evaluator[Tree]()
+    eval_graph.add_atom_generic(lambda atom: atom)
+    eval_graph.add_opn(f, f_op)
+
+    # f(f(...f(x)...)) doubled at each level: 2**5 - 1 tree nodes, 5 distinct.
+    expr = x
+    for _ in range(5):
+        expr = f(expr, expr)
+
+    assert eval_graph.eval_recursive(expr, {}) == expr
+    assert len(calls) == 5
+
+
+def test_Evaluator_deeply_nested() -> None:
+    """Test that deep nesting does not hit the Python recursion limit."""
+    [f], [x] = funcs_symbols(["f"], ["x"])
+
+    expr = x
+    for _ in range(3000):
+        expr = f(expr)
+
+    rebuild = Transformer()
+    assert rebuild(expr) == expr
+    assert rebuild.eval_recursive(expr, {}) == expr
+
 
 def test_Transformer() -> None:
     """Test defining and using a Transformer."""
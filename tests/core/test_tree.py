@@ -120,6 +120,9 @@ def test_forward_graph() -> None:
 
     assert forward_graph(expr) == expected
 
+    # The graph is computed once and cached on the Tree.
+    assert forward_graph(expr) is forward_graph(expr)
+
 
 def test_subsfunc() -> None:
     """Test basic functionality of SubsFunc."""
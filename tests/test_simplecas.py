@@ -24,6 +24,7 @@ from protosym.simplecas import (
     y,
     zero,
 )
+from protosym.core.exceptions import NoEvaluationRuleError
 from protosym.simplecas.exceptions import ExpressifyError, LLVMNotImplementedError
 from pytest import raises, skip
 
@@ -70,7 +71,7 @@ def test_simplecas_identity() -> None:
 def test_xreplace() -> None:
     """Test simple substitutions with xreplace."""
     expr = x**2 + 1
-    assert expr.xreplace({x: 1}) == Integer(1) ** 2 + 1
+    assert expr.xreplace({x: 1}) == Pow(Integer(1), 2) + 1
     assert expr.xreplace({x: y}) == y**2 + 1
     assert expr.xreplace({x**2: y}) == y + 1
     assert expr.xreplace({x**2 + 1: y}) == y
@@ -103,6 +104,30 @@ def test_simplecas_operations_expressify() -> None:
     assert 2**x == two**x == Pow(two, x)
 
 
+def test_simplecas_constant_folding() -> None:
+    """Test constant folding in the arithmetic operators."""
+    assert one + two == Integer(3)
+    assert two * two == Integer(4)
+    assert two**two == Integer(4)
+    assert two - one == one
+    assert 2 - two == zero
+    assert x + 0 == x
+    assert 0 + x == x
+    assert x * 1 == x
+    assert 1 * x == x
+    assert x * 0 == zero
+    assert 0 * x == zero
+    assert x**1 == x
+    assert x**0 == one
+    # Negative powers are not integers and are left unevaluated.
+    assert two**negone == Pow(two, negone)
+    # Explicit constructors never fold.
+    assert Add(one, two) != Integer(3)
+    assert str(Add(one, two)) == "(1 + 2)"
+    assert Mul(one, x) != x
+    assert Pow(x, one) != x
+
+
 def test_simplecas_operations_bad_type() -> None:
     """Test arithmetic operations fail for Expr and other types."""
     bad_pairs = [(x, ()), ((), x)]
@@ -118,6 +143,8 @@ def test_simplecas_expressify() -> None:
     """Test that the expressify function works in basic cases."""
     assert expressify(1) == Integer(1)
     assert expressify(x) == x
+    # bool is an int subclass that misses the exact type fast path.
+    assert expressify(True) == Integer(1)
     raises(ExpressifyError, lambda: expressify([]))
 
 
@@ -142,11 +169,14 @@ def test_simplecas_repr() -> None:
     assert str(f(x)) == "f(x)"
     assert str(sin(cos(x))) == "sin(cos(x))"
     assert str(x + y) == "(x + y)"
-    assert str(one + two) == "(1 + 2)"
+    assert str(Add(one, two)) == "(1 + 2)"
     assert str(x * y) == "(x*y)"
     assert str(x**two) == "x**2"
-    assert str(x + x + x) == "((x + x) + x)"
-    assert repr(x + x + x) == "((x + x) + x)"
+    assert str(x + x + x) == "(x + x + x)"
+    assert repr(x + x + x) == "(x + x + x)"
+    assert x + x + x == Add(x, x, x)
+    assert x * x * x == Mul(x, x, x)
+    assert x + (x + x) == Add(x, Add(x, x))
 
 
 def test_simplecas_latex() -> None:
@@ -157,10 +187,45 @@ def test_simplecas_latex() -> None:
     assert sin(x).eval_latex() == r"\sin(x)"
     assert sin(cos(x)).eval_latex() == r"\sin(\cos(x))"
     assert (x + y).eval_latex() == r"(x + y)"
-    assert (one + two).eval_latex() == r"(1 + 2)"
+    assert Add(one, two).eval_latex() == r"(1 + 2)"
     assert (x * y).eval_latex() == r"(x \times y)"
     assert (x**two).eval_latex() == r"x^{2}"
-    assert (x + x + x).eval_latex() == r"((x + x) + x)"
+    assert (x + x + x).eval_latex() == r"(x + x + x)"
+
+
+def test_simplecas_print_fallback() -> None:
+    """Test printing expressions not handled by the fast printer."""
+    # A wild atom is outside the fast printer's atom types so repr falls back
+    # to the eval_repr evaluator and latex raises as it always did.
+    w = Expr.new_wild("w")
+    assert str(sin(x) + w) == "(sin(x) + w)"
+    raises(NoEvaluationRuleError, lambda: (sin(x) + w).eval_latex())
+
+
+def test_simplecas_print_registered_rule() -> None:
+    """Test that rules registered with the print evaluators are honoured."""
+    from protosym.core.sym import PyOp1
+    from protosym.simplecas.expr import eval_repr
+
+    tan = Function("tan")
+    expr1 = tan(x)
+    assert str(expr1) == "tan(x)"
+
+    # A head rule registered with the eval_repr Evaluator makes the fast
+    # printer fall back for expressions using that head.
+    eval_repr[tan(a)] = PyOp1[str](lambda s: f"TAN({s})")(a)
+    expr2 = tan(y)
+    assert str(expr2) == "TAN(y)"
+    assert str(sin(tan(y)) + x) == "(sin(TAN(y)) + x)"
+
+
+def test_simplecas_eval_memoized() -> None:
+    """Test that string and numeric forms are cached on the Expr."""
+    expr = sin(x) + cos(y)
+    assert expr.eval_repr() is expr.eval_repr()
+    assert expr.eval_latex() is expr.eval_latex()
+    assert sin(one).eval_f64() == sin(one).eval_f64()
+    assert sin(x).eval_f64({x: 1.0}) == sin(one).eval_f64()
 
 
 def test_simplecas_repr_latex() -> None:
@@ -245,6 +310,53 @@ def test_simplecas_eval_f64() -> None:
     assert one.eval_f64() == 1.0
 
 
+def test_simplecas_eval_f64_compiled() -> None:
+    """Test the bytecode compiled path of eval_f64."""
+    from protosym.simplecas.bytecode import compile_f64
+
+    expr = sin(cos(x)) * x**2 + 1
+    # The compiled program is cached on the underlying Tree.
+    program = compile_f64(expr.rep)
+    assert program is not None
+    assert compile_f64(expr.rep) is program
+    assert program({x.rep: 1.0}) == expr.eval_f64({x: 1.0})
+
+    # Unknown heads cannot be compiled and fall back to the Evaluator.
+    assert compile_f64(f(x).rep) is None
+    raises(NoEvaluationRuleError, lambda: f(x).eval_f64({x: 1.0}))
+    # A missing value for a symbol also falls back to the Evaluator.
+    raises(NoEvaluationRuleError, lambda: sin(x).eval_f64())
+
+
+def test_simplecas_eval_f64_evaluator() -> None:
+    """Test the generic eval_f64 Evaluator rules directly."""
+    from protosym.simplecas.expr import eval_f64
+
+    assert eval_f64(x + y, {x: 1.0, y: 2.0}) == 3.0
+    assert eval_f64(Add(x, y, one), {x: 1.0, y: 2.0}) == 4.0
+    assert eval_f64(sin(x) * cos(y) ** 2, {x: 1.0, y: 2.0}) == sin(
+        one
+    ).eval_f64() * cos(Integer(2)).eval_f64() ** 2
+
+
+@requires_numpy
+def test_simplecas_eval_f64_array() -> None:
+    """Test evaluating an expression over NumPy arrays."""
+    import numpy as np
+
+    arr = np.linspace(0.0, 1.0, 5)
+
+    expr = sin(cos(x)) * x**2 + 1
+    expected = np.array([expr.eval_f64({x: float(v)}) for v in arr])
+    assert np.allclose(expr.eval_f64_array({x: arr}), expected)
+
+    assert np.allclose((x + y).eval_f64_array({x: arr, y: arr}), 2 * arr)
+    assert one.eval_f64_array() == 1.0
+
+    raises(NoEvaluationRuleError, lambda: f(x).eval_f64_array({x: arr}))
+    raises(NoEvaluationRuleError, lambda: sin(x).eval_f64_array())
+
+
 def test_simplecas_count_ops() -> None:
     """Test count_ops_graph and count_ops_tree."""
 
@@ -280,8 +392,8 @@ def test_simplecas_differentation() -> None:
     assert sin(x).diff(x) == cos(x)
     assert cos(x).diff(x) == -sin(x)
     assert (sin(x) + cos(x)).diff(x) == cos(x) + -1 * sin(x)
-    assert (sin(x) ** 2).diff(x) == 2 * sin(x) ** Add(2, -1) * cos(x)
-    assert (x * sin(x)).diff(x) == 1 * sin(x) + x * cos(x)
+    assert (sin(x) ** 2).diff(x) == Mul(2 * sin(x) ** Add(2, -1), cos(x))
+    assert (x * sin(x)).diff(x) == Mul(1, sin(x)) + x * cos(x)
 
 
 def test_simplecas_differentiation_rules() -> None:
@@ -451,6 +563,30 @@ def test_simplecas_lambdify_llvm_mat() -> None:
     raises(LLVMNotImplementedError, lambda: lambdify([], Matrix([[x]])))
 
 
+def test_simplecas_lambdify_numba() -> None:
+    """Test lambdify_numba (falls back to plain Python without numba)."""
+    from protosym.simplecas import lambdify_numba
+    from protosym.simplecas.exceptions import CodegenNotImplementedError
+
+    expr1 = sin(cos(x)) * x**2 + 1
+    func1 = lambdify_numba([x], expr1)
+    assert func1(1.0) == expr1.eval_f64({x: 1.0})
+
+    func2 = lambdify_numba([x, y], x + y)
+    assert func2(1.0, 2.0) == 3.0
+
+    func3 = lambdify_numba([], sin(one))
+    assert func3() == sin(one).eval_f64()
+
+    # Negative constants must be parenthesized so that e.g. (-2.0) ** x does
+    # not generate -(2.0 ** x).
+    func4 = lambdify_numba([x], Integer(-2) ** x)
+    assert func4(2.0) == 4.0
+
+    raises(CodegenNotImplementedError, lambda: lambdify_numba([x], f(x)))
+    raises(CodegenNotImplementedError, lambda: lambdify_numba([], sin(x)))
+
+
 def test_simplecas_lambdify_llvm_bad() -> None:
     """Test lambdify unrecognised expression."""
     raises(TypeError, lambda: lambdify([x], {}))  # type:ignore